@@ -6,6 +6,7 @@ Simple example on how to use the ClassificationTrustee class to extract
 a decision tree from a RandomForestClassifier from scikit-learn.
 """
 # importing required libraries
+import os
 # importing Scikit-learn library and datasets package
 import graphviz
 
@@ -74,7 +75,11 @@ dot_data = tree.export_graphviz(
     special_characters=True,
 )
 graph = graphviz.Source(dot_data)
-graph.render("dt_explanation")
+if os.environ.get("TRUSTEE_RENDER"):
+    # rendering shells out to the `dot` binary to produce a PDF, so only do it on demand
+    graph.render("dt_explanation")
+else:
+    graph.save("dt_explanation.dot")
 
 # Output pruned decision tree to pdf
 dot_data = tree.export_graphviz(
@@ -86,4 +91,8 @@ dot_data = tree.export_graphviz(
     special_characters=True,
 )
 graph = graphviz.Source(dot_data)
-graph.render("pruned_dt_explation")
+if os.environ.get("TRUSTEE_RENDER"):
+    # rendering shells out to the `dot` binary to produce a PDF, so only do it on demand
+    graph.render("pruned_dt_explation")
+else:
+    graph.save("pruned_dt_explation.dot")
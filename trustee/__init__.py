@@ -1,2 +1,17 @@
+import os
+import warnings
+
+GPU_ACCELERATION = False
+if os.environ.get("TRUSTEE_USE_GPU"):
+    # cuml.accel must patch scikit-learn estimators before sklearn is first
+    # imported, so this has to run ahead of every other trustee import
+    try:
+        import cuml.accel
+
+        cuml.accel.install()
+        GPU_ACCELERATION = True
+    except ImportError:
+        warnings.warn("TRUSTEE_USE_GPU is set, but cuML is not installed. Falling back to CPU execution.")
+
 from .main import *
 from ._version import __version__
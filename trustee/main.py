@@ -15,7 +15,7 @@ from sklearn.metrics import f1_score, r2_score
 from sklearn.model_selection import train_test_split
 from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
 
-from trustee.utils.tree import get_dt_info, top_k_prune
+from trustee.utils.tree import get_dt_info, top_k_indexes, top_k_prune, unpack_splits
 from trustee.utils.dataset import convert_to_df, convert_to_series
 
 
@@ -462,7 +462,7 @@ class Trustee(abc.ABC):
         right = self._best_student.tree_.children_right
         samples = self._best_student.tree_.n_node_samples
 
-        return np.sum([n_samples if left[node] != right[node] else 0 for node, n_samples in enumerate(samples)])
+        return np.sum(samples[left != right])
 
     @_check_if_trained
     def get_top_branches(self, top_k=10):
@@ -484,7 +484,10 @@ class Trustee(abc.ABC):
         if not self._branches:
             self._features, self._nodes, self._branches = get_dt_info(self._best_student)
 
-        return sorted(self._branches, key=lambda p: p["samples"], reverse=True)[:top_k]
+        branch_samples = np.fromiter(
+            (branch["samples"] for branch in self._branches), dtype=float, count=len(self._branches)
+        )
+        return [self._branches[i] for i in top_k_indexes(branch_samples, top_k)]
 
     @_check_if_trained
     def get_top_features(self, top_k=10):
@@ -507,7 +510,11 @@ class Trustee(abc.ABC):
         if not self._features:
             self._features, self._nodes, self._branches = get_dt_info(self._best_student)
 
-        return sorted(self._features.items(), key=lambda p: p[1]["samples"], reverse=True)[:top_k]
+        feature_items = list(self._features.items())
+        feature_samples = np.fromiter(
+            (values["samples"] for (_, values) in feature_items), dtype=float, count=len(feature_items)
+        )
+        return [feature_items[i] for i in top_k_indexes(feature_samples, top_k)]
 
     @_check_if_trained
     def get_top_nodes(self, top_k=10):
@@ -534,9 +541,9 @@ class Trustee(abc.ABC):
         if not self._nodes:
             self._features, self._nodes, self._branches = get_dt_info(self._best_student)
 
-        return sorted(
-            self._nodes, key=lambda p: p["samples"] * abs(p["gini_split"][0] - p["gini_split"][1]), reverse=True
-        )[:top_k]
+        # rank nodes on the splits structure of arrays and only materialize dicts for the top-k
+        keys = self._nodes["samples"] * np.abs(self._nodes["gini_left"] - self._nodes["gini_right"])
+        return unpack_splits(self._nodes, top_k_indexes(keys, top_k))
 
     @_check_if_trained
     def get_samples_by_level(self):
@@ -551,10 +558,8 @@ class Trustee(abc.ABC):
         if not self._nodes:
             self._features, self._nodes, self._branches = get_dt_info(self._best_student)
 
-        samples_by_level = list(np.zeros(self._best_student.get_depth() + 1))
-        for node in self._nodes:
-            samples_by_level[node["level"]] += node["samples"]
-
+        depth = self._best_student.get_depth() + 1
+        samples_by_level = list(np.bincount(self._nodes["level"], weights=self._nodes["samples"], minlength=depth))
         for node in self._branches:
             samples_by_level[node["level"]] += node["samples"]
 
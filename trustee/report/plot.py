@@ -310,23 +310,24 @@ def plot_stability(
     for idx, it in enumerate(stability_iter):
         iter_tree = it[f"{base_tree_key}"]
         _, splits, _ = get_dt_info(iter_tree)
-        total_nodes += len(splits)
+        num_splits = len(splits["idx"])
+        total_nodes += num_splits
         features_by_it[idx] = 0
-        number_of_splits.append(len(splits))
+        number_of_splits.append(num_splits)
 
-        for split in splits:
-            split_str = f"{split['feature']}-{split['threshold']}"
+        for feature, threshold in zip(splits["feature"], splits["threshold"]):
+            split_str = f"{feature}-{threshold}"
             if split_str not in nodes:
                 nodes[split_str] = 0
             nodes[split_str] += 1
 
-            if split["feature"] not in features:
-                features[split["feature"]] = {}
+            if feature not in features:
+                features[feature] = {}
 
-            if idx not in features[split["feature"]]:
-                features[split["feature"]][idx] = 0
+            if idx not in features[feature]:
+                features[feature][idx] = 0
                 features_by_it[idx] += 1
-            features[split["feature"]][idx] += 1
+            features[feature][idx] += 1
 
         y_pred = iter_tree.predict(X_test.values)
         fidelity.append(it[f"{base_tree_key}_fidelity"])
@@ -15,10 +15,12 @@ from sklearn.base import clone
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, f1_score, r2_score
 
-from prettytable import PrettyTable
+from joblib import Parallel, delayed
 
-from trustee import ClassificationTrustee, RegressionTrustee
-from trustee.utils.tree import get_dt_info
+from prettytable import ALL, PrettyTable
+
+from trustee import GPU_ACCELERATION, ClassificationTrustee, RegressionTrustee
+from trustee.utils.tree import branchless_predict, get_top_feature
 from trustee.utils.dataset import convert_to_df, convert_to_series
 
 from .plot import (
@@ -35,6 +37,81 @@ from .plot import (
 )
 
 
+def _ablate_feature(
+    blackbox,
+    X_train,
+    X_test,
+    y_train,
+    feature,
+    is_classify=True,
+    predict_method_name="predict",
+    refit=True,
+    use_features=None,
+    trustee_params=None,
+):
+    """
+    Trains a blackbox copy and extracts a Trustee explanation with a single feature zeroed out.
+    Used as an independent unit of work by the parallel feature removal analysis.
+
+    Parameters
+    ----------
+    blackbox: object
+        The ML blackbox model to analyze. Must be compatible with sklearn.base.clone when `refit` is True.
+
+    X_train: pandas DataFrame of shape (n_samples, n_features)
+        The training input samples.
+
+    X_test: pandas DataFrame of shape (n_samples, n_features)
+        The test input samples.
+
+    y_train: pandas Series of shape (n_samples,)
+        The target values for X_train.
+
+    feature: int
+        Index of the feature to zero out before training.
+
+    is_classify: bool, default=True
+        Whether given blackbox is a classifier or regressor.
+
+    predict_method_name: str, default="predict"
+        The method interface to use to get predictions from the expert model.
+
+    refit: bool, default=True
+        Whether to retrain a blackbox copy from scratch with the ablated data.
+        When False, the already-trained blackbox is reused.
+
+    use_features: array-like, default=None
+        Array-like of integers representing the indexes of features from the `X` training samples
+        used to train the student decision tree model.
+
+    trustee_params: dict, default=None
+        Extra keyword arguments forwarded to Trustee `fit()`.
+
+    Returns
+    -------
+    result: tuple
+        (y_pred, dt, dt_y_pred)
+    """
+    X_train = X_train.copy()
+    X_test = X_test.copy()
+    X_train.iloc[:, feature] = 0
+    X_test.iloc[:, feature] = 0
+
+    if refit:
+        blackbox = clone(blackbox)
+        blackbox.fit(X_train, y_train)
+
+    y_pred = getattr(blackbox, predict_method_name)(X_test)
+
+    trustee = ClassificationTrustee(expert=blackbox) if is_classify else RegressionTrustee(expert=blackbox)
+    trustee.fit(X_train, y_train, use_features=use_features, **(trustee_params or {}))
+
+    dt, _, _, _ = trustee.explain()
+    dt_y_pred = dt.predict(X_test.iloc[:, use_features].values if use_features is not None else X_test.values)
+
+    return y_pred, dt, dt_y_pred
+
+
 class TrustReport:
     """Class to generate Trust Report."""
 
@@ -60,6 +137,10 @@ class TrustReport:
         analyze_branches=False,
         analyze_stability=False,
         skip_retrain=False,
+        refit_blackbox=True,
+        feature_removal_greedy=True,
+        feature_removal_n_jobs=-1,
+        use_gpu=False,
         top_k=10,
         logger=None,
         verbose=False,
@@ -158,6 +239,30 @@ class TrustReport:
             Used to evaluate the impact of each feature in training by iteratively removing top features.
             Works well for scikit-explain model, but can be troublesome for other libraries (especially AutoGluon).
 
+        refit_blackbox: bool, default=True
+            Boolean indicating whether the blackbox model should be retrained from scratch at every iteration
+            of the feature removal analysis. When False, the already-trained blackbox is reused and its
+            predictions simply see the removed features as constant zero columns, skipping one full blackbox
+            training per iteration.
+
+        feature_removal_greedy: bool, default=True
+            Boolean indicating whether the feature removal analysis should greedily remove the top feature
+            of the previous iteration's explanation, which forces iterations to run sequentially. When False,
+            each of the top `max_iter` features of the main explanation is ablated independently instead,
+            which allows iterations to run in parallel.
+
+        feature_removal_n_jobs: int, default=-1
+            Number of jobs to run in parallel for the independent feature removal analysis.
+            -1 means using all processors. Ignored when `feature_removal_greedy` is True.
+
+        use_gpu: bool, default=False
+            Boolean indicating whether to accelerate blackbox retraining and prediction with NVIDIA cuML,
+            so supported scikit-learn estimators transparently dispatch fit/predict calls to the GPU,
+            which mostly benefits the repeated blackbox retraining of the feature removal analysis.
+            Since `cuml.accel` must patch estimators before scikit-learn is first imported, this requires
+            the optional `cuml` package and the `TRUSTEE_USE_GPU` environment variable to be set before
+            trustee is imported; otherwise the report falls back to CPU execution.
+
         top_k: int, default=10
             Number of top-k branches, sorted by number of samples per branch, to keep after finding
             decision tree with highest fidelity.
@@ -202,6 +307,10 @@ class TrustReport:
         self.analyze_branches = analyze_branches
         self.analyze_stability = analyze_stability
         self.skip_retrain = skip_retrain
+        self.refit_blackbox = refit_blackbox
+        self.feature_removal_greedy = feature_removal_greedy
+        self.feature_removal_n_jobs = feature_removal_n_jobs
+        self.use_gpu = use_gpu
         self.top_k = top_k
         self.logger = logger
         self.verbose = verbose
@@ -268,6 +377,17 @@ class TrustReport:
         self.whitebox_iter = []
 
         log = self.logger.log if self.logger else print
+
+        if self.use_gpu and not GPU_ACCELERATION:
+            # cuml.accel can only patch scikit-learn estimators before sklearn is first
+            # imported, which is long past by the time this constructor runs
+            log(
+                "WARNING: use_gpu=True, but GPU acceleration was not installed at import time. "
+                "Set the TRUSTEE_USE_GPU environment variable before importing trustee to enable it. "
+                "Falling back to CPU execution."
+            )
+            self.use_gpu = False
+
         log("Running Trust Report...")
         self._prepare_data()
         self._collect()
@@ -394,14 +514,18 @@ class TrustReport:
         single_analysis = PrettyTable(title="Single-run Analysis", header=False)
         single_analysis_first_row = PrettyTable(header=False, border=False)
 
+        # rows are precomputed and added in one add_rows call per table, with hrules
+        # providing the visual separation previously done with blank spacer rows
         top_features = PrettyTable(
             title=f"Top {len(self.max_dt_top_features)} Features",
             field_names=["Feature", "# of Nodes (%)", "Data Split % - ↓"],
+            hrules=ALL,
         )
 
         sum_nodes = 0
         sum_nodes_perc = 0
         sum_data_split = 0
+        top_features_rows = []
         for (feat, values) in self.max_dt_top_features:
             node, node_perc, data_split = (
                 values["count"],
@@ -412,23 +536,22 @@ class TrustReport:
             sum_nodes_perc += node_perc
             sum_data_split += data_split
 
-            top_features.add_row(
+            top_features_rows.append(
                 [
                     self.feature_names[feat] if self.feature_names else feat,
                     f"{node} ({node_perc:.2f}%)",
                     f"{values['samples']} ({data_split:.2f}%)",
                 ]
             )
-            top_features.add_row(["", "", ""])
 
-        top_features.add_row(["-" * 10, "-" * 10, "-" * 10])
-        top_features.add_row(
+        top_features_rows.append(
             [
                 f"Top {len(self.max_dt_top_features)} Summary",
                 f"{sum_nodes} ({sum_nodes_perc:.2f}%)",
                 f"{sum_data_split:.2f}%",
             ]
         )
+        top_features.add_rows(top_features_rows)
 
         top_nodes = PrettyTable(
             title=f"Top {len(self.max_dt_top_nodes)} Nodes",
@@ -438,10 +561,12 @@ class TrustReport:
                 "Data Split % - ↓",
                 "Data Split % by Class (L/R)",
             ],
+            hrules=ALL,
         )
         top_nodes.align = "l"
         top_nodes.valign = "m"
 
+        top_nodes_rows = []
         for node in self.max_dt_top_nodes:
             samples_by_class = [
                 (
@@ -453,7 +578,7 @@ class TrustReport:
             ]
             samples_left = (node["data_split"][0] / self.max_dt.tree_.n_node_samples[0]) * 100
             samples_right = (node["data_split"][1] / self.max_dt.tree_.n_node_samples[0]) * 100
-            top_nodes.add_row(
+            top_nodes_rows.append(
                 [
                     f"{self.feature_names[node['feature']] if self.feature_names else node['feature']} <= {node['threshold']}",
                     f"Left: {node['gini_split'][0]:.2f} \nRight: {node['gini_split'][1]:.2f}",
@@ -461,11 +586,13 @@ class TrustReport:
                     "\n".join(f"{row[0]}: {row[1]:.2f}% / {row[2]:.2f}%" for row in samples_by_class),
                 ]
             )
-            top_nodes.add_row(["", "", "", ""])
+
+        top_nodes.add_rows(top_nodes_rows)
 
         top_branches = PrettyTable(
             title=f"Top {len(self.max_dt_top_branches)} Branches",
             field_names=["Rule", "Decision (P(x))", "Samples (%) - ↓", "Class Samples (%)"],
+            hrules=ALL,
         )
         top_branches.align = "l"
         top_branches.valign = "m"
@@ -473,6 +600,7 @@ class TrustReport:
         sum_samples = 0
         sum_samples_perc = 0
         sum_class_samples_perc = {}
+        top_branches_rows = []
         for branch in self.max_dt_top_branches:
             samples, samples_perc, class_samples_perc = (
                 branch["samples"],
@@ -491,7 +619,7 @@ class TrustReport:
                 if self.class_names is not None and branch["class"] < len(self.class_names)
                 else branch["class"],
             )
-            top_branches.add_row(
+            top_branches_rows.append(
                 [
                     "\n and ".join(
                         [
@@ -504,10 +632,8 @@ class TrustReport:
                     f"{class_samples_perc:.2f}%",
                 ]
             )
-            top_branches.add_row(["", "", "", ""])
 
-        top_branches.add_row(["-" * 10, "-" * 10, "-" * 10, "-" * 10])
-        top_branches.add_row(
+        top_branches_rows.append(
             [
                 f"Top {len(self.max_dt_top_branches)} Summary",
                 "-",
@@ -520,6 +646,7 @@ class TrustReport:
                 ),
             ]
         )
+        top_branches.add_rows(top_branches_rows)
 
         single_analysis_first_row.add_column("Top Nodes", [top_nodes])
         single_analysis_first_row.add_column("Top Branches", [top_branches])
@@ -538,22 +665,25 @@ class TrustReport:
                     "Performance",
                     "Fidelity",
                 ],
+                hrules=ALL,
             )
             top_k_prune_performance.align = "l"
             top_k_prune_performance.valign = "m"
 
+            top_k_prune_rows = []
             for i in self.top_k_prune_iter:
-                top_k_prune_performance.add_row(
+                top_k_prune_rows.append(
                     [
                         i["top_k"],
                         i["dt"].tree_.node_count,
                         i["dt"].get_depth(),
                         i["dt"].get_n_leaves(),
-                        i["score_report"],
-                        i["fidelity_report"],
+                        # report strings are built lazily here, at render time
+                        self._score_report(self.y_test, i["dt_y_pred"]),
+                        self._score_report(i["y_pred"], i["dt_y_pred"]),
                     ]
                 )
-                top_k_prune_performance.add_row(["", "", "", "", "", ""])
+            top_k_prune_performance.add_rows(top_k_prune_rows)
 
             alpha_performance = PrettyTable(
                 title="CCP Alpha Iteration",
@@ -566,23 +696,26 @@ class TrustReport:
                     "Performance",
                     "Fidelity",
                 ],
+                hrules=ALL,
             )
             alpha_performance.align = "l"
             alpha_performance.valign = "m"
 
+            alpha_rows = []
             for i in self.ccp_iter:
-                alpha_performance.add_row(
+                alpha_rows.append(
                     [
                         i["ccp_alpha"],
                         f"{i['gini']:.3f}",
                         i["dt"].tree_.node_count,
                         i["dt"].get_depth(),
                         i["dt"].get_n_leaves(),
-                        i["score_report"],
-                        i["fidelity_report"],
+                        # report strings are built lazily here, at render time
+                        self._score_report(self.y_test, i["dt_y_pred"]),
+                        self._score_report(i["y_pred"], i["dt_y_pred"]),
                     ]
                 )
-                alpha_performance.add_row(["", "", "", "", "", "", ""])
+            alpha_performance.add_rows(alpha_rows)
 
             max_depth_performance = PrettyTable(
                 title="Max Depth Iteration",
@@ -594,22 +727,25 @@ class TrustReport:
                     "Performance",
                     "Fidelity",
                 ],
+                hrules=ALL,
             )
             max_depth_performance.align = "l"
             max_depth_performance.valign = "m"
 
+            max_depth_rows = []
             for i in self.max_depth_iter:
-                max_depth_performance.add_row(
+                max_depth_rows.append(
                     [
                         i["max_depth"],
                         i["dt"].tree_.node_count,
                         i["dt"].get_depth(),
                         i["dt"].get_n_leaves(),
-                        i["score_report"],
-                        i["fidelity_report"],
+                        # report strings are built lazily here, at render time
+                        self._score_report(self.y_test, i["dt_y_pred"]),
+                        self._score_report(i["y_pred"], i["dt_y_pred"]),
                     ]
                 )
-                max_depth_performance.add_row(["", "", "", "", "", ""])
+            max_depth_performance.add_rows(max_depth_rows)
 
             max_leaves_performance = PrettyTable(
                 title="Max Leaves Iteration",
@@ -621,22 +757,25 @@ class TrustReport:
                     "Performance",
                     "Fidelity",
                 ],
+                hrules=ALL,
             )
             max_leaves_performance.align = "l"
             max_leaves_performance.valign = "m"
 
+            max_leaves_rows = []
             for i in self.max_leaves_iter:
-                max_leaves_performance.add_row(
+                max_leaves_rows.append(
                     [
                         i["max_leaves"],
                         i["dt"].tree_.node_count,
                         i["dt"].get_depth(),
                         i["dt"].get_n_leaves(),
-                        i["score_report"],
-                        i["fidelity_report"],
+                        # report strings are built lazily here, at render time
+                        self._score_report(self.y_test, i["dt_y_pred"]),
+                        self._score_report(i["y_pred"], i["dt_y_pred"]),
                     ]
                 )
-                max_leaves_performance.add_row(["", "", "", "", "", ""])
+            max_leaves_performance.add_rows(max_leaves_rows)
 
             prunning_analysis.add_column(
                 "Prunning Iteration",
@@ -655,22 +794,24 @@ class TrustReport:
                     "Decision Tree Size",
                     "Fidelity",
                 ],
+                hrules=ALL,
             )
             iter_performance.align = "l"
             iter_performance.valign = "m"
 
+            iter_rows = []
             for i in self.whitebox_iter:
-                iter_performance.add_row(
+                iter_rows.append(
                     [
                         i["it"],
                         self.feature_names[i["feature_removed"]] if self.feature_names else i["feature_removed"],
                         i["n_features_removed"],
-                        i["score_report"],
+                        self._score_report(self.y_test, i["y_pred"]),
                         i["dt"].tree_.node_count,
-                        i["fidelity_report"],
+                        self._score_report(i["y_pred"], i["dt_y_pred"]),
                     ]
                 )
-                iter_performance.add_row(["", "", "", "", "", ""])
+            iter_performance.add_rows(iter_rows)
 
             repeated_analysis.add_column("Iterative Feature Removal", [iter_performance])
 
@@ -689,6 +830,37 @@ class TrustReport:
 
         return r2_score(y, y_pred)
 
+    def _score_fast(self, y, y_pred):
+        """
+        Same as _score, but derives the classification F1-score from a single binned
+        confusion-matrix pass over the predictions instead of separate sklearn scans.
+        Falls back to _score for regression and non-integer labels.
+        """
+        if not self.is_classify:
+            return self._score(y, y_pred)
+
+        y = np.asarray(y)
+        y_pred = np.asarray(y_pred)
+        if (
+            not np.issubdtype(y.dtype, np.integer)
+            or not np.issubdtype(y_pred.dtype, np.integer)
+            or min(y.min(), y_pred.min()) < 0
+        ):
+            return self._score(y, y_pred)
+
+        n_classes = int(max(self.bb_n_output_classes, y.max() + 1, y_pred.max() + 1))
+        cm = np.zeros((n_classes, n_classes), dtype=np.int64)
+        np.add.at(cm, (y, y_pred), 1)
+
+        true_pos = np.diag(cm)
+        false_pos = cm.sum(axis=0) - true_pos
+        false_neg = cm.sum(axis=1) - true_pos
+        # macro-average only over labels present in either y or y_pred, matching f1_score
+        present = (true_pos + false_pos + false_neg) > 0
+        f1 = 2 * true_pos[present] / (2 * true_pos[present] + false_pos[present] + false_neg[present])
+
+        return f1.mean() if len(f1) else 0.0
+
     def _score_report(self, y, y_pred):
         if self.is_classify:
             return f"\n{classification_report(y, y_pred, digits=3, zero_division=0)}"
@@ -763,6 +935,14 @@ class TrustReport:
                 log(f"X size: {len(self.X)}; y size: {len(self.y)}")
                 log("Done!")
 
+        # is_numeric_dtype, unlike np.issubdtype, accepts pandas extension dtypes,
+        # leaving categorical frames untouched instead of raising
+        if all(pd.api.types.is_numeric_dtype(dtype) for dtype in self.X_train.dtypes):
+            # keep features as a single contiguous float32 block, so every downstream
+            # pandas -> numpy conversion is zero-copy and half the bytes of float64
+            self.X_train = self.X_train.astype(np.float32)
+            self.X_test = self.X_test.astype(np.float32)
+
         self.dataset_size = len(self.X_train) + len(self.X_test)
         self.train_size = len(self.X_train) / self.dataset_size
 
@@ -782,6 +962,7 @@ class TrustReport:
         trustee_ccp_alpha=0.0,
         trustee_max_leaf_nodes=None,
         trustee_max_depth=None,
+        refit=True,
     ):
         """
         Fits blackbox with the given X and y data, and uses Trustee to extract DT explanation
@@ -816,6 +997,10 @@ class TrustReport:
             trustee_max_depth: int, default=None
                 The maximum depth of the tree. If None, then nodes are expanded until all leaves are pure.
                 If none is provided the default TrustReport value is used.
+
+            refit: bool, default=True
+                Whether to retrain the blackbox model from scratch with the given X data.
+                When False, the already-trained blackbox is reused and only Trustee is refitted.
         """
         log = self.logger.log if self.logger else print
 
@@ -825,7 +1010,7 @@ class TrustReport:
         X_train = X_train if X_train is not None else self.X_train
         X_test = X_test if X_test is not None else self.X_test
 
-        if self.skip_retrain:
+        if self.skip_retrain or not refit:
             blackbox_copy = self.blackbox
         else:
             # clone blackbox params but resets training weights to allow retraining with new dataset
@@ -904,8 +1089,9 @@ class TrustReport:
             log(f"Model explanation training (agreement, fidelity): ({agreement}, {reward})")
             log(f"Top-k Prunned explanation size: {min_dt.tree_.node_count}")
 
-        dt_y_pred = dt.predict(X_test.iloc[:, self.use_features].values)
-        min_dt_y_pred = min_dt.predict(X_test.iloc[:, self.use_features].values)
+        X_test_values = X_test.iloc[:, self.use_features].values
+        dt_y_pred = branchless_predict(dt, X_test_values)
+        min_dt_y_pred = branchless_predict(min_dt, X_test_values)
 
         if self.verbose:
             log("Model explanation global fidelity report:")
@@ -940,7 +1126,10 @@ class TrustReport:
             self._collect_max_leaves_prunning()
 
         if not self.skip_retrain:
-            self._collect_features_iter_removal()
+            if self.feature_removal_greedy:
+                self._collect_features_iter_removal()
+            else:
+                self._collect_features_independent_removal()
 
         self._progress(finish=100)
 
@@ -951,7 +1140,12 @@ class TrustReport:
             log("Collecting blackbox information...")
 
         self.bb_n_input_features = len(self.X_train.columns)
-        self.bb_n_output_classes = len(np.unique(self.y_train))
+        # for 0..K-1 integer labels a linear max beats the O(N log N) sort inside np.unique;
+        # pd.api.types handles pandas extension dtypes (e.g. nullable Int64), which np.issubdtype does not
+        if pd.api.types.is_integer_dtype(self.y_train.dtype) and self.y_train.min() >= 0:
+            self.bb_n_output_classes = int(self.y_train.max()) + 1
+        else:
+            self.bb_n_output_classes = len(np.unique(self.y_train))
         if self.verbose:
             log("Done!")
 
@@ -1010,10 +1204,8 @@ class TrustReport:
                     "dt": pruned_dt,
                     "y_pred": self.y_pred,
                     "dt_y_pred": pruned_dt_y_pred,
-                    "score": self._score(self.y_test, pruned_dt_y_pred),
-                    "score_report": self._score_report(self.y_test, pruned_dt_y_pred),
-                    "fidelity": self._score(self.y_pred, pruned_dt_y_pred),
-                    "fidelity_report": self._score_report(self.y_pred, pruned_dt_y_pred),
+                    "score": self._score_fast(self.y_test, pruned_dt_y_pred),
+                    "fidelity": self._score_fast(self.y_pred, pruned_dt_y_pred),
                 }
             )
             self._progress()
@@ -1041,8 +1233,8 @@ class TrustReport:
                 {
                     "max_dt": max_dt,
                     "min_dt": min_dt,
-                    "max_dt_fidelity": self._score(y_pred, max_dt_y_pred),
-                    "min_dt_fidelity": self._score(y_pred, min_dt_y_pred),
+                    "max_dt_fidelity": self._score_fast(y_pred, max_dt_y_pred),
+                    "min_dt_fidelity": self._score_fast(y_pred, min_dt_y_pred),
                     "iteration": i,
                     "top_branches": top_branches,
                 }
@@ -1072,10 +1264,8 @@ class TrustReport:
                     "dt": pruned_dt,
                     "y_pred": self.y_pred,
                     "dt_y_pred": pruned_dt_y_pred,
-                    "score": self._score(self.y_test, pruned_dt_y_pred),
-                    "score_report": self._score_report(self.y_test, pruned_dt_y_pred),
-                    "fidelity": self._score(self.y_pred, pruned_dt_y_pred),
-                    "fidelity_report": self._score_report(self.y_pred, pruned_dt_y_pred),
+                    "score": self._score_fast(self.y_test, pruned_dt_y_pred),
+                    "fidelity": self._score_fast(self.y_pred, pruned_dt_y_pred),
                 }
             )
             self._progress()
@@ -1109,10 +1299,8 @@ class TrustReport:
                         "dt": ccp_dt,
                         "y_pred": self.y_pred,
                         "dt_y_pred": ccp_dt_y_pred,
-                        "score": self._score(self.y_test, ccp_dt_y_pred),
-                        "score_report": self._score_report(self.y_test, ccp_dt_y_pred),
-                        "fidelity": self._score(self.y_pred, ccp_dt_y_pred),
-                        "fidelity_report": self._score_report(self.y_pred, ccp_dt_y_pred),
+                        "score": self._score_fast(self.y_test, ccp_dt_y_pred),
+                        "fidelity": self._score_fast(self.y_pred, ccp_dt_y_pred),
                     }
                 )
                 self._progress()
@@ -1140,10 +1328,8 @@ class TrustReport:
                         "dt": max_depth_dt,
                         "y_pred": self.y_pred,
                         "dt_y_pred": max_depth_dt_y_pred,
-                        "score": self._score(self.y_test, max_depth_dt_y_pred),
-                        "score_report": self._score_report(self.y_test, max_depth_dt_y_pred),
-                        "fidelity": self._score(self.y_pred, max_depth_dt_y_pred),
-                        "fidelity_report": self._score_report(self.y_pred, max_depth_dt_y_pred),
+                        "score": self._score_fast(self.y_test, max_depth_dt_y_pred),
+                        "fidelity": self._score_fast(self.y_pred, max_depth_dt_y_pred),
                     }
                 )
                 self._progress()
@@ -1173,10 +1359,8 @@ class TrustReport:
                         "dt": max_leaves_dt,
                         "y_pred": self.y_pred,
                         "dt_y_pred": max_leaves_dt_y_pred,
-                        "score": self._score(self.y_test, max_leaves_dt_y_pred),
-                        "score_report": self._score_report(self.y_test, max_leaves_dt_y_pred),
-                        "fidelity": self._score(self.y_pred, max_leaves_dt_y_pred),
-                        "fidelity_report": self._score_report(self.y_pred, max_leaves_dt_y_pred),
+                        "score": self._score_fast(self.y_test, max_leaves_dt_y_pred),
+                        "fidelity": self._score_fast(self.y_pred, max_leaves_dt_y_pred),
                     }
                 )
                 self._progress()
@@ -1194,20 +1378,28 @@ class TrustReport:
 
         i = 0
         n_features_removed = 0
+        removed = set()
         top_feature_to_remove = self.max_dt_top_features[0][0]
-        X_train_iter = self.X_train.copy()
-        X_test_iter = self.X_test.copy()
+        # capture the underlying ndarrays once so features can be zeroed with plain
+        # NumPy strided stores, instead of going through the pandas indexer every iteration
+        X_train_arr = self.X_train.to_numpy(copy=True)
+        X_test_arr = self.X_test.to_numpy(copy=True)
+        X_train_iter = pd.DataFrame(X_train_arr, index=self.X_train.index, columns=self.X_train.columns, copy=False)
+        X_test_iter = pd.DataFrame(X_test_arr, index=self.X_test.index, columns=self.X_test.columns, copy=False)
 
         while i < self.max_iter and n_features_removed < len(self.use_features) - 1:
             if self.verbose:
                 log(f"Iteration {i + 1}/{min(self.max_iter, len(self.use_features))}")
 
             # remove most significant feature
-            X_train_iter.iloc[:, top_feature_to_remove] = 0
-            X_test_iter.iloc[:, top_feature_to_remove] = 0
+            X_train_arr[:, top_feature_to_remove] = 0
+            X_test_arr[:, top_feature_to_remove] = 0
+            removed.add(top_feature_to_remove)
 
             n_features_removed += 1
-            _, y_pred, dt, dt_y_pred, _, _ = self._fit_and_explain(X_train=X_train_iter, X_test=X_test_iter)
+            _, y_pred, dt, dt_y_pred, _, _ = self._fit_and_explain(
+                X_train=X_train_iter, X_test=X_test_iter, refit=self.refit_blackbox
+            )
 
             self.whitebox_iter.append(
                 {
@@ -1217,24 +1409,84 @@ class TrustReport:
                     "dt_y_pred": dt_y_pred,
                     "feature_removed": top_feature_to_remove,
                     "n_features_removed": n_features_removed,
-                    "score": self._score(self.y_test, y_pred),
-                    "score_report": self._score_report(self.y_test, y_pred),
-                    "fidelity": self._score(y_pred, dt_y_pred),
-                    "fidelity_report": self._score_report(y_pred, dt_y_pred),
+                    "score": self._score_fast(self.y_test, y_pred),
+                    "fidelity": self._score_fast(y_pred, dt_y_pred),
                 }
             )
 
-            iter_dt_features, _, _ = get_dt_info(dt)
-            iter_dt_top_features = sorted(iter_dt_features.items(), key=lambda p: p[1]["samples"], reverse=True)[
-                : self.top_k
-            ]
-            top_feature_to_remove = iter_dt_top_features[0][0]
+            if dt.tree_.node_count <= 1:
+                # student degenerated to a single leaf, so there is no feature left to remove
+                break
+
+            # only the most-sampled feature is needed here, so skip the full get_dt_info pass;
+            # features already zeroed are skipped, since removing them again would be a no-op
+            # that still pays for a full blackbox retrain
+            top_feature_to_remove = get_top_feature(dt, exclude=removed)
+            if top_feature_to_remove is None:
+                # the student only splits on already-removed features, so further iterations are redundant
+                break
+
             i += 1
             self._progress()
 
         if self.verbose:
             log("Done!")
 
+    def _collect_features_independent_removal(self):
+        """Uses provided dataset to train multiple Decision Trees by ablating each top feature independently, in parallel"""
+        log = self.logger.log if self.logger else print
+        if self.verbose:
+            log("Collecting features prunning information...")
+
+        # fetch up to max_iter candidates directly, since max_dt_top_features only holds top_k entries
+        features_to_try = [feat for (feat, _) in self.trustee.get_top_features(top_k=self.max_iter)]
+        trustee_params = {
+            "top_k": self.top_k,
+            "num_iter": self.trustee_num_iter,
+            "num_stability_iter": self.trustee_num_stability_iter,
+            "samples_size": self.trustee_sample_size,
+            "predict_method_name": self.predict_method_name,
+            "max_leaf_nodes": self.trustee_max_leaf_nodes,
+            "max_depth": self.trustee_max_depth,
+            "ccp_alpha": self.trustee_ccp_alpha,
+            "verbose": self.verbose,
+        }
+
+        results = Parallel(n_jobs=self.feature_removal_n_jobs, prefer="processes")(
+            delayed(_ablate_feature)(
+                self.blackbox,
+                self.X_train,
+                self.X_test,
+                self.y_train,
+                feature,
+                is_classify=self.is_classify,
+                predict_method_name=self.predict_method_name,
+                refit=self.refit_blackbox,
+                use_features=self.use_features,
+                trustee_params=trustee_params,
+            )
+            for feature in features_to_try
+        )
+
+        self.whitebox_iter = []
+        for i, (feature, (y_pred, dt, dt_y_pred)) in enumerate(zip(features_to_try, results)):
+            self.whitebox_iter.append(
+                {
+                    "it": i,
+                    "dt": dt,
+                    "y_pred": y_pred,
+                    "dt_y_pred": dt_y_pred,
+                    "feature_removed": feature,
+                    "n_features_removed": 1,
+                    "score": self._score_fast(self.y_test, y_pred),
+                    "fidelity": self._score_fast(y_pred, dt_y_pred),
+                }
+            )
+            self._progress()
+
+        if self.verbose:
+            log("Done!")
+
     def _save_dts(self, output_dir, save_all=False):
         """
         Save the decision trees.
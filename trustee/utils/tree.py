@@ -4,6 +4,12 @@ from copy import deepcopy
 
 from sklearn.tree._tree import TREE_LEAF, TREE_UNDEFINED, NODE_DTYPE
 
+try:
+    # optional accelerator for decision tree traversal; the NumPy path is used without it
+    import numba
+except ImportError:
+    numba = None
+
 
 def prune_index(dt, index, prune_level):
     """Prunes the given decision tree at the given index and returns the number of pruned nodes"""
@@ -96,67 +102,180 @@ def get_dt_info(dt):
     samples = dt.tree_.n_node_samples
     impurity = dt.tree_.impurity
 
-    splits = []
-    features_used = {}
+    # precompute per-node aggregates in single vectorized passes,
+    # instead of calling np.sum/np.argmax on tiny slices at every node
+    vals = values[:, 0, :]
+    node_totals = vals.sum(axis=1)
+    node_classes = vals.argmax(axis=1)
+    multiclass = vals.shape[1] > 1
+
+    is_leaf = children_left == children_right
+    # sklearn stores nodes in depth-first order, so ascending indexes preserve traversal order
+    internal_nodes = np.where(~is_leaf)[0]
+
+    # node levels in one pass: children always have higher indexes than their parent
+    levels = np.zeros(len(is_leaf), dtype=int)
+    for node in internal_nodes:
+        levels[children_left[node]] = levels[children_right[node]] = levels[node] + 1
+
+    counts = np.bincount(features[internal_nodes], minlength=0)
+    samples_sums = np.bincount(features[internal_nodes], weights=samples[internal_nodes], minlength=0)
+    features_used = {
+        feature: {"count": int(counts[feature]), "samples": int(samples_sums[feature])}
+        for feature in np.unique(features[internal_nodes])
+    }
 
-    def walk_tree(node, level, path):
-        """Recursively iterates through all nodes in given decision tree and returns them as a list."""
-        if children_left[node] == children_right[node]:  # if leaf node
-            node_class = np.argmax(values[node][0]) if len(np.array(values[node][0])) > 1 else values[node][0][0]
-            node_prob = (
-                (values[node][0][node_class] / np.sum(values[node][0])) * 100
-                if np.array(values[node][0]).ndim > 1
-                else 0
-            )
-            return [
+    # splits are kept as a structure of parallel arrays instead of one dict per node,
+    # so consumers can rank and filter them without materializing per-node objects
+    left_children = children_left[internal_nodes]
+    right_children = children_right[internal_nodes]
+    splits = {
+        "idx": internal_nodes,
+        "level": levels[internal_nodes],
+        "feature": features[internal_nodes],
+        "threshold": thresholds[internal_nodes],
+        "samples": samples[internal_nodes],
+        "values": values[internal_nodes],
+        "gini_left": impurity[left_children],
+        "gini_right": impurity[right_children],
+        "data_split_left": node_totals[left_children],
+        "data_split_right": node_totals[right_children],
+        "class_left": vals[left_children],
+        "class_right": vals[right_children],
+    }
+
+    # iterative DFS with an explicit stack replaces the recursive walk,
+    # keeping branches in the same left-to-right leaf order; paths are tuples
+    # so extending them per level shares no intermediate list copies
+    branches = []
+    stack = [(0, ())]
+    while stack:
+        node, path = stack.pop()
+        if is_leaf[node]:
+            branches.append(
                 {
-                    "level": level,
+                    "level": levels[node],
                     "path": path,
-                    "class": node_class,
-                    "prob": node_prob,
+                    "class": node_classes[node] if multiclass else vals[node][0],
+                    "prob": (vals[node][node_classes[node]] / node_totals[node]) * 100 if vals[node].ndim > 1 else 0,
                     "samples": samples[node],
                 }
-            ]
+            )
+        else:
+            feature = features[node]
+            threshold = thresholds[node]
+            # push right child first so the left subtree is visited first
+            stack.append((children_right[node], path + ((node, feature, ">", threshold),)))
+            stack.append((children_left[node], path + ((node, feature, "<=", threshold),)))
 
-        feature = features[node]
-        threshold = thresholds[node]
-        left = children_left[node]
-        right = children_right[node]
+    return features_used, splits, branches
+
+
+def unpack_splits(splits, indexes):
+    """Materializes per-node dicts for the given subset of indexes from the splits structure of arrays."""
+    return [
+        {
+            "idx": splits["idx"][i],
+            "level": splits["level"][i],
+            "feature": splits["feature"][i],
+            "threshold": splits["threshold"][i],
+            "samples": splits["samples"][i],
+            "values": splits["values"][i],
+            "gini_split": (splits["gini_left"][i], splits["gini_right"][i]),
+            "data_split": (splits["data_split_left"][i], splits["data_split_right"][i]),
+            "data_split_by_class": list(zip(splits["class_left"][i], splits["class_right"][i])),
+        }
+        for i in indexes
+    ]
+
+
+def top_k_indexes(keys, top_k):
+    """Returns the indexes of the top_k largest keys in descending order, without fully sorting keys."""
+    keys = np.asarray(keys)
+    if top_k >= len(keys):
+        return np.argsort(-keys, kind="stable")
+
+    indexes = np.argpartition(-keys, top_k)[:top_k]
+    return indexes[np.argsort(-keys[indexes], kind="stable")]
+
+
+def get_top_feature(dt, exclude=None):
+    """
+    Returns the feature of the given Decision Tree with the highest sum of samples across split nodes,
+    skipping any feature in exclude. Returns None when no feature outside exclude splits the tree.
+    """
+    features = dt.tree_.feature
+    samples = dt.tree_.n_node_samples
+    mask = features >= 0
+
+    samples_sums = np.bincount(features[mask], weights=samples[mask])
+    if exclude:
+        for feature in exclude:
+            if feature < len(samples_sums):
+                samples_sums[feature] = 0
+
+    # bincount leaves 0-valued slots for non-splitting features, while any
+    # splitting feature has a positive weighted count
+    if not len(samples_sums) or samples_sums.max() <= 0:
+        return None
+
+    return samples_sums.argmax()
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _predict_leaves(X, features, thresholds, children_left, children_right):
+        """Finds the leaf each row of X lands in, with rows traversed in parallel."""
+        leaves = np.empty(X.shape[0], dtype=np.intp)
+        for i in numba.prange(X.shape[0]):  # pylint: disable=not-an-iterable
+            node = 0
+            while children_left[node] != children_right[node]:
+                if X[i, features[node]] <= thresholds[node]:
+                    node = children_left[node]
+                else:
+                    node = children_right[node]
+            leaves[i] = node
+        return leaves
+
+
+def branchless_predict(dt, X):
+    """
+    Predicts outputs for X by traversing the flat decision tree arrays with vectorized
+    NumPy selects, advancing all rows one level per step instead of interpreting the
+    tree per sample. Uses a numba-compiled parallel traversal when numba is installed.
+    Equivalent to dt.predict(X).
+    """
+    features = dt.tree_.feature
+    thresholds = dt.tree_.threshold
+    children_left = dt.tree_.children_left
+    children_right = dt.tree_.children_right
 
-        if feature not in features_used:
-            features_used[feature] = {"count": 0, "samples": 0}
+    # per-leaf outputs are precomputed once for the whole tree
+    vals = dt.tree_.value[:, 0, :]
+    leaf_output = dt.classes_[vals.argmax(axis=1)] if hasattr(dt, "classes_") else vals[:, 0]
 
-        features_used[feature]["count"] += 1
-        features_used[feature]["samples"] += samples[node]
+    X = np.ascontiguousarray(X, dtype=np.float64)
 
-        splits.append(
-            {
-                "idx": node,
-                "level": level,
-                "feature": feature,
-                "threshold": threshold,
-                "samples": samples[node],
-                "values": values[node],
-                "gini_split": (impurity[left], impurity[right]),
-                "data_split": (np.sum(values[left]), np.sum(values[right])),
-                "data_split_by_class": [
-                    (c_left, c_right) for (c_left, c_right) in zip(values[left][0], values[right][0])
-                ],
-            }
-        )
+    if numba is not None:
+        return leaf_output[_predict_leaves(X, features, thresholds, children_left, children_right)]
 
-        return walk_tree(left, level + 1, path + [(node, feature, "<=", threshold)]) + walk_tree(
-            right, level + 1, path + [(node, feature, ">", threshold)]
-        )
+    nodes = np.zeros(len(X), dtype=np.intp)
+    active = np.where(children_left[nodes] != TREE_LEAF)[0]
+    while len(active):
+        current = nodes[active]
+        go_left = X[active, features[current]] <= thresholds[current]
+        nodes[active] = np.where(go_left, children_left[current], children_right[current])
+        active = active[children_left[nodes[active]] != TREE_LEAF]
 
-    branches = walk_tree(0, 0, [])
-    return features_used, splits, branches
+    return leaf_output[nodes]
 
 
 def top_k_prune(dt, top_k, max_impurity=0.1):
     """Prunes a given decision tree down to its top-k branches, sorted by number of samples covered"""
-    _, nodes, branches = get_dt_info(dt)
-    top_branches = sorted(branches, key=lambda p: p["samples"], reverse=True)[:top_k]
+    _, splits, branches = get_dt_info(dt)
+    branch_samples = np.fromiter((branch["samples"] for branch in branches), dtype=float, count=len(branches))
+    top_branches = [branches[i] for i in top_k_indexes(branch_samples, top_k)]
     prunned_dt = deepcopy(dt)
 
     nodes_to_keep = set({})
@@ -165,9 +284,9 @@ def top_k_prune(dt, top_k, max_impurity=0.1):
             if dt.tree_.impurity[node] > max_impurity:
                 nodes_to_keep.add(node)
 
-    for node in nodes:
-        if node["idx"] not in nodes_to_keep:
-            prune_index(prunned_dt, node["idx"], 0)
+    for node in splits["idx"]:
+        if node not in nodes_to_keep:
+            prune_index(prunned_dt, node, 0)
 
     # update classifier with prunned model
     prunned_dt.tree_.__setstate__(get_dt_dict(prunned_dt))